@@ -120,35 +120,38 @@ validate_token() {
     
     echo "🔐 Validating GitHub token..."
     
-    # Test token with user endpoint
+    # One call: the HTTP status says whether the token works, the body holds the quota
     local response
-    response=$(curl -s -H "Authorization: token $token" https://api.github.com/user 2>/dev/null)
+    response=$(curl -s -w "HTTPSTATUS:%{http_code}" -H "Authorization: token $token" https://api.github.com/rate_limit 2>/dev/null)
     
-    if echo "$response" | grep -q '"login"'; then
-        local username
-        username=$(echo "$response" | grep -o '"login": "[^"]*' | cut -d'"' -f4)
-        echo "✅ Token is valid - authenticated as: $username"
-        
-        # Check rate limit
-        local rate_response
-        rate_response=$(curl -s -H "Authorization: token $token" https://api.github.com/rate_limit 2>/dev/null)
-        if echo "$rate_response" | grep -q '"remaining"'; then
+    local http_code
+    http_code=$(echo "$response" | grep -o "HTTPSTATUS:[0-9]*" | cut -d: -f2)
+    local body
+    body=$(echo "$response" | sed 's/HTTPSTATUS:[0-9]*$//')
+    
+    case "$http_code" in
+        200)
+            echo "✅ Token is valid"
+            
+            # The core limit is the first resource listed
             local remaining limit
-            remaining=$(echo "$rate_response" | grep -o '"remaining": [0-9]*' | cut -d' ' -f2)
-            limit=$(echo "$rate_response" | grep -o '"limit": [0-9]*' | cut -d' ' -f2)
-            echo "📊 API Rate limit: $remaining/$limit requests remaining"
-        fi
-        
-        return 0
-    elif echo "$response" | grep -q '"message": "Bad credentials"'; then
-        echo "❌ Token is invalid or expired"
-        echo "   Response: Bad credentials"
-        return 1
-    else
-        echo "❌ Token validation failed"
-        echo "   Response: $response" | head -c 100
-        return 1
-    fi
+            remaining=$(echo "$body" | grep -o '"remaining": *[0-9]*' | head -1 | grep -o '[0-9]*$')
+            limit=$(echo "$body" | grep -o '"limit": *[0-9]*' | head -1 | grep -o '[0-9]*$')
+            if [ -n "$remaining" ] && [ -n "$limit" ]; then
+                echo "📊 API Rate limit: $remaining/$limit requests remaining"
+            fi
+            return 0
+            ;;
+        401)
+            echo "❌ Token is invalid or expired"
+            echo "   Response: Bad credentials"
+            return 1
+            ;;
+        *)
+            echo "❌ Token validation failed with status: $http_code"
+            return 1
+            ;;
+    esac
 }
 
 # Function to get repositories with full info
@@ -266,11 +269,11 @@ sync_repos() {
             printf "Syncing %s... " "$repo_name"
             
             # Try different sync strategies
-            if (cd "$repo_dir" && git fetch --all && git pull) &>/dev/null; then
+            if (cd "$repo_dir" && git "${GIT_AUTH_ARGS[@]}" fetch --all && git "${GIT_AUTH_ARGS[@]}" pull) &>/dev/null; then
                 echo "✅"
                 echo "✅ $repo_name (synced)" >> "$target_dir/clone_summary.txt"
                 ((successful++))
-            elif (cd "$repo_dir" && git fetch --all) &>/dev/null; then
+            elif (cd "$repo_dir" && git "${GIT_AUTH_ARGS[@]}" fetch --all) &>/dev/null; then
                 echo "🔄 (fetched only)"
                 echo "🔄 $repo_name (fetched only)" >> "$target_dir/clone_summary.txt"
                 ((successful++))
@@ -313,24 +316,17 @@ clone_repos() {
         IFS='|' read -r repo_name full_name is_private clone_url <<< "$repo_info"
         local num=$((i + 1))
         
-        # Determine clone URL and privacy indicator
-        local actual_clone_url="$clone_url"
+        # Determine privacy indicator (the token is passed to git by setup_git_auth)
         local privacy_indicator="🔓"
         
         if [ "$is_private" = "true" ]; then
             privacy_indicator="🔒"
-            if [ -n "$GITHUB_TOKEN" ]; then
-                actual_clone_url="https://${GITHUB_TOKEN}@github.com/${full_name}.git"
-            fi
-        elif [ -n "$GITHUB_TOKEN" ]; then
-            # Use authenticated URL for all repos when token is available for better reliability
-            actual_clone_url="https://${GITHUB_TOKEN}@github.com/${full_name}.git"
         fi
         
         printf "[%d/%d] Cloning %s %s... " "$num" "${#repos[@]}" "$privacy_indicator" "$repo_name"
         
         local clone_output
-        clone_output=$(git clone "$actual_clone_url" "$MASTER_FOLDER/$repo_name" 2>&1)
+        clone_output=$(git "${GIT_AUTH_ARGS[@]}" clone "$clone_url" "$MASTER_FOLDER/$repo_name" 2>&1)
         
         if [ $? -eq 0 ]; then
             echo "✅"
@@ -354,6 +350,37 @@ clone_repos() {
     echo "📊 Summary: $successful successful, $failed failed"
 }
 
+# Extra git arguments carrying the token, only needed for git older than 2.31
+GIT_AUTH_ARGS=()
+
+# Function to pass the GitHub token to git as an HTTP header, keeping it out of
+# clone URLs, .git/config and process listings
+setup_git_auth() {
+    # Fail instead of waiting for a username/password prompt
+    export GIT_TERMINAL_PROMPT=0
+    
+    if [ -n "$GITHUB_TOKEN" ]; then
+        local auth
+        auth=$(printf 'x-access-token:%s' "$GITHUB_TOKEN" | base64 | tr -d '\n')
+        
+        # GIT_CONFIG_COUNT/KEY/VALUE is ignored before git 2.31, so older git gets the header
+        # with -c, which does show it in process listings
+        local git_version major minor
+        git_version=$(git --version | grep -o '[0-9][0-9.]*' | head -1)
+        IFS='.' read -r major minor _ <<< "$git_version"
+        if [ "${major:-0}" -gt 2 ] || { [ "${major:-0}" -eq 2 ] && [ "${minor:-0}" -ge 31 ]; }; then
+            # Take the next free GIT_CONFIG_<n> slot so entries the user exported still apply
+            local index="${GIT_CONFIG_COUNT:-0}"
+            export "GIT_CONFIG_KEY_$index=http.https://github.com/.extraheader"
+            export "GIT_CONFIG_VALUE_$index=Authorization: Basic $auth"
+            export GIT_CONFIG_COUNT=$((index + 1))
+        else
+            echo "⚠️  git $git_version is older than 2.31 - the GitHub token is passed to git on the command line"
+            GIT_AUTH_ARGS=(-c "http.https://github.com/.extraheader=Authorization: Basic $auth")
+        fi
+    fi
+}
+
 # Main execution
 main() {
     # Check if git is available
@@ -374,6 +401,7 @@ main() {
     if ! validate_token "$GITHUB_TOKEN" && [ -n "$GITHUB_TOKEN" ]; then
         echo "⚠️  Continuing with invalid token - some operations may fail"
     fi
+    setup_git_auth
     
     # Get repositories from the organization first
     echo "🔍 Fetching repositories for $ORG_NAME..."
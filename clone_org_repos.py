@@ -6,11 +6,34 @@ Usage: python3 clone_org_repos.py [organization_name]
 """
 
 import os
+import re
 import sys
+import base64
+import json
+import shutil
 import subprocess
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 def load_config():
     """Load configuration from config.env file"""
@@ -28,7 +51,7 @@ def load_config():
 def get_repo_statistics(repos):
     """Calculate repository statistics"""
     total = len(repos)
-    private = sum(1 for repo in repos if repo.get('private', False))
+    private = sum(repo.private for repo in repos)
     public = total - private
     return {
         'total': total,
@@ -47,37 +70,97 @@ def print_repo_summary(repos, title="Repository Summary"):
     print("=" * 50)
     return stats
 
-def validate_token(token):
+# Seconds to wait for the GitHub API to connect or send data before giving up on a request
+API_TIMEOUT = 30
+# Connections kept open to api.github.com; concurrent API requests are capped at this
+API_POOL_SIZE = 20
+
+def create_session(token=None):
+    """Create a pooled HTTP session for the GitHub API, reused across all requests"""
+    session = requests.Session()
+    # 429 responses carry a Retry-After header, which urllib3 waits for before retrying.
+    # Once retries run out the last response is returned, so it is reported like any other error.
+    retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                    raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=API_POOL_SIZE, max_retries=retries))
+    session.headers.update({
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "clone-org-repos",
+    })
+    if token:
+        session.headers.update({"Authorization": f"token {token}"})
+    return session
+
+def parse_json(content):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def write_repo_statistics(summary_file, stats):
+    """Append repository statistics to the summary file"""
+    with open(summary_file, 'a') as f:
+        f.write("REPOSITORY STATISTICS:\n")
+        f.write(f"🔓 Public repositories:  {stats['public']}\n")
+        f.write(f"🔒 Private repositories: {stats['private']}\n")
+        f.write(f"📦 Total repositories:   {stats['total']}\n")
+        f.write("========================================\n")
+
+# Last X-RateLimit-* values seen per quota ("core" for REST, "graphql"), shared by all request threads
+RATE_LIMITS = {
+    resource: {'remaining': None, 'reset': 0, 'announced': None} for resource in ('core', 'graphql')
+}
+_rate_limit_lock = threading.Lock()
+
+def api_request(session, method, url, resource='core', **kwargs):
+    """Send a GitHub API request, waiting for its rate limit to reset rather than running into it"""
+    rate_limit = RATE_LIMITS[resource]
+    # Only a quota GitHub has reported as used up is waited for. Requests are not counted
+    # locally, as conditional requests answered with 304 do not use any quota.
+    with _rate_limit_lock:
+        remaining, reset = rate_limit['remaining'], rate_limit['reset']
+        delay = reset - time.time() if remaining == 0 else 0
+        if delay > 0 and rate_limit['announced'] != reset:
+            rate_limit['announced'] = reset
+            print(f"⏳ API rate limit used up - waiting {int(delay) + 1}s for it to reset")
+    if delay > 0:
+        time.sleep(delay + 1)
+    
+    response = session.request(method, url, timeout=API_TIMEOUT, **kwargs)
+    
+    if 'X-RateLimit-Remaining' in response.headers and 'X-RateLimit-Reset' in response.headers:
+        with _rate_limit_lock:
+            rate_limit['remaining'] = int(response.headers['X-RateLimit-Remaining'])
+            rate_limit['reset'] = int(response.headers['X-RateLimit-Reset'])
+    return response
+
+def validate_token(session, token):
     """Validate GitHub token and show rate limit info"""
     if not token:
         print("⚠️  No GitHub token provided - using unauthenticated requests (60 requests/hour limit)")
         return False
     
     print(f"🔐 Validating GitHub token...")
-    headers = {"Authorization": f"token {token}"}
     
     try:
-        # Test token with user endpoint
-        response = requests.get("https://api.github.com/user", headers=headers)
+        # /rate_limit rejects a bad token with 401 like any other endpoint and is free to call,
+        # so a single request both validates the token and reports the remaining quota
+        response = api_request(session, "GET", "https://api.github.com/rate_limit")
         
         if response.status_code == 200:
-            user_data = response.json()
-            username = user_data.get('login', 'Unknown')
-            print(f"✅ Token is valid - authenticated as: {username}")
-            
-            # Check rate limit
-            rate_response = requests.get("https://api.github.com/rate_limit", headers=headers)
-            if rate_response.status_code == 200:
-                rate_data = rate_response.json()
-                core_limit = rate_data['resources']['core']
-                remaining = core_limit['remaining']
-                limit = core_limit['limit']
-                print(f"📊 API Rate limit: {remaining}/{limit} requests remaining")
+            core_limit = parse_json(response.content)['resources']['core']
+            remaining = core_limit['remaining']
+            limit = core_limit['limit']
+            print("✅ Token is valid")
+            print(f"📊 API Rate limit: {remaining}/{limit} requests remaining")
+            scopes = response.headers.get('X-OAuth-Scopes')
+            if scopes is not None:
+                print(f"🔑 Token scopes: {scopes or 'none'}")
             
             return True
         elif response.status_code == 401:
             print(f"❌ Token is invalid or expired")
-            print(f"   Response: {response.json().get('message', 'Unknown error')}")
+            print(f"   Response: {parse_json(response.content).get('message', 'Unknown error')}")
             return False
         else:
             print(f"❌ Token validation failed with status: {response.status_code}")
@@ -87,114 +170,513 @@ def validate_token(token):
         print(f"❌ Error validating token: {e}")
         return False
 
-def get_repositories(org_name, token=None):
-    """Fetch all repositories from the organization"""
-    repos = []
-    page = 1
-    headers = {"Authorization": f"token {token}"} if token else {}
-    
-    print(f"🔍 Fetching repositories for {org_name}...")
+def check_repos_response(response, org_name, token=None):
+    """Report API errors for a repository listing page, returning True if it is usable"""
+    if response.status_code == 404:
+        print(f"❌ Organization '{org_name}' not found")
+        if not token:
+            print("   💡 Try with a valid GitHub token if this is a private organization")
+        return False
+    elif response.status_code == 401:
+        print(f"❌ Authentication failed")
+        print("   💡 Check if your GitHub token is valid and has the right permissions")
+        return False
+    elif response.status_code == 403:
+        print(f"❌ Access forbidden (403)")
+        if 'rate limit' in response.text.lower():
+            print("   💡 API rate limit exceeded. Try again later or use a valid GitHub token")
+        else:
+            print("   💡 Token may not have permission to access this organization")
+        return False
+    elif response.status_code != 200:
+        print(f"❌ API error: {response.status_code}")
+        print(f"   Response: {response.text[:200]}")
+        return False
+    return True
+
+def get_last_page(response):
+    """Read the last page number from the Link header (1 if there is only one page)"""
+    last_url = response.links.get('last', {}).get('url')
+    if not last_url:
+        return 1
+    query = parse_qs(urlparse(last_url).query)
+    return int(query.get('page', ['1'])[0])
+
+# The only repository fields the script uses; the rest of each API record is dropped
+Repo = namedtuple('Repo', ['name', 'clone_url', 'private'])
+PER_PAGE = 100
+
+class ListingError(Exception):
+    """The repository listing stopped because the API returned an error (already reported)"""
+
+LISTING_CACHE_VERSION = 2
+
+def listing_cache_file(org_name):
+    """Path of the cached listing pages and ETags for an organization (LISTING_CACHE=0 disables it)"""
+    # Resolved per call so XDG_CACHE_HOME can also come from config.env
+    cache_home = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache")
+    return cache_home / "clone_org_repos" / f"{org_name}.json"
+
+def load_listing_cache(org_name):
+    """Load the cached listing pages for an organization ({page: {"etag", "repos"}})"""
+    if os.getenv('LISTING_CACHE', '1') == '0':
+        return {}
+    try:
+        with open(listing_cache_file(org_name), 'rb') as f:
+            data = parse_json(f.read())
+        if data.get('version') != LISTING_CACHE_VERSION:
+            return {}
+        pages = data['pages']
+        for entry in pages.values():
+            entry['repos'] = [Repo(*fields) for fields in entry['repos']]
+        return pages
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+def save_listing_cache(org_name, cache):
+    """Save the listing pages for an organization; the cache is best effort"""
+    if os.getenv('LISTING_CACHE', '1') == '0':
+        return
+    try:
+        cache_file = listing_cache_file(org_name)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({'version': LISTING_CACHE_VERSION, 'pages': cache}, f)
+    except OSError as e:
+        print(f"⚠️  Could not write repository listing cache: {e}")
+
+# GraphQL query for one page of an organization's repositories, selecting only the fields used
+REPOS_GRAPHQL_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name url isPrivate }
+    }
+  }
+}
+"""
+
+def iter_repositories_graphql(session, org_name, token=None):
+    """Yield the organization's repositories as Repo tuples using the GraphQL API"""
+    print(f"🔍 Fetching repositories for {org_name} (GraphQL)...")
     
+    count = 0
+    cursor = None
+    # Pages are cursor based, so unlike REST they are fetched one after another
     while True:
-        url = f"https://api.github.com/orgs/{org_name}/repos"
-        params = {"page": page, "per_page": 100}
-        
-        response = requests.get(url, headers=headers, params=params)
+        try:
+            response = api_request(
+                session, "POST", "https://api.github.com/graphql", resource='graphql',
+                json={"query": REPOS_GRAPHQL_QUERY, "variables": {"org": org_name, "cursor": cursor}}
+            )
+        except requests.RequestException as e:
+            print(f"❌ API request failed: {e}")
+            raise ListingError(org_name) from e
+        if not check_repos_response(response, org_name, token):
+            raise ListingError(org_name)
+        result = parse_json(response.content)
+        if result.get('errors'):
+            print(f"❌ GraphQL error: {result['errors'][0].get('message', 'Unknown error')}")
+            raise ListingError(org_name)
         
-        if response.status_code == 404:
-            print(f"❌ Organization '{org_name}' not found")
-            if not token:
-                print("   💡 Try with a valid GitHub token if this is a private organization")
-            return []
-        elif response.status_code == 401:
-            print(f"❌ Authentication failed")
-            print("   💡 Check if your GitHub token is valid and has the right permissions")
-            return []
-        elif response.status_code == 403:
-            print(f"❌ Access forbidden (403)")
-            if 'rate limit' in response.text.lower():
-                print("   💡 API rate limit exceeded. Try again later or use a valid GitHub token")
-            else:
-                print("   💡 Token may not have permission to access this organization")
-            return []
-        elif response.status_code != 200:
-            print(f"❌ API error: {response.status_code}")
-            print(f"   Response: {response.text[:200]}")
-            return []
+        repositories = result['data']['organization']['repositories']
+        for node in repositories['nodes']:
+            yield Repo(node['name'], f"{node['url']}.git", node['isPrivate'])
+        count += len(repositories['nodes'])
         
-        page_repos = response.json()
-        if not page_repos:
+        if not repositories['pageInfo']['hasNextPage']:
             break
-            
-        repos.extend(page_repos)
+        cursor = repositories['pageInfo']['endCursor']
+    
+    print(f"✅ Found {count} repositories")
+
+def iter_repositories(session, org_name, token=None):
+    """Yield the organization's repositories as Repo tuples, raising ListingError if a page fails"""
+    if os.getenv('GITHUB_API', 'rest') == 'graphql':
+        if token:
+            yield from iter_repositories_graphql(session, org_name, token)
+            return
+        print("⚠️  GITHUB_API=graphql needs a GitHub token - using the REST API")
+    
+    url = f"https://api.github.com/orgs/{org_name}/repos"
+    cache = load_listing_cache(org_name)
+    new_cache = {}
+    
+    def fetch_page(page):
+        # Pages unchanged since the last run come back as 304 Not Modified, which costs no quota
+        cached = cache.get(str(page))
+        headers = {"If-None-Match": cached['etag']} if cached else None
+        try:
+            return api_request(session, "GET", url, params={"page": page, "per_page": PER_PAGE}, headers=headers)
+        except requests.RequestException as e:
+            # Connection errors and timeouts end the listing like an API error response
+            print(f"❌ API request failed: {e}")
+            raise ListingError(org_name) from e
+    
+    def read_page(page, response):
+        """Return the repositories on a page, raising ListingError if the API returned an error"""
+        cached = cache.get(str(page))
+        if response.status_code == 304 and cached:
+            new_cache[str(page)] = cached
+            return cached['repos']
+        if not check_repos_response(response, org_name, token):
+            raise ListingError(org_name)
+        page_repos = [Repo(repo['name'], repo['clone_url'], bool(repo.get('private'))) for repo in parse_json(response.content)]
+        if 'ETag' in response.headers:
+            new_cache[str(page)] = {'etag': response.headers['ETag'], 'repos': page_repos}
+        return page_repos
+    
+    print(f"🔍 Fetching repositories for {org_name}...")
+    
+    # The first page tells us how many pages there are, so the rest can be fetched concurrently
+    response = fetch_page(1)
+    found = read_page(1, response)
+    yield from found
+    count = len(found)
+    
+    # A 304 may come without a Link header, in which case the page count is the cached one
+    page_count_cached = response.status_code == 304 and 'last' not in response.links
+    if page_count_cached:
+        last_page = cache['1'].get('last_page', 1)
+    else:
+        last_page = get_last_page(response)
+    
+    if last_page > 1:
+        # GitHub flags bursts of concurrent requests as abuse, so keep the fan-out bounded
+        # More threads than pooled connections would discard connections instead of reusing them
+        api_jobs = min(get_job_count('GITHUB_API_JOBS', 8), API_POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=min(api_jobs, last_page - 1)) as executor:
+            # map() yields responses in page order, keeping the listing stable
+            for page, response in zip(range(2, last_page + 1), executor.map(fetch_page, range(2, last_page + 1))):
+                found = read_page(page, response)
+                yield from found
+                count += len(found)
+    
+    # Repositories created since the cached page count may have spilled onto new pages
+    page = last_page
+    while page_count_cached and len(found) == PER_PAGE:
         page += 1
+        found = read_page(page, fetch_page(page))
+        yield from found
+        count += len(found)
+    
+    if '1' in new_cache:
+        new_cache['1']['last_page'] = page
+    save_listing_cache(org_name, new_cache)
+    print(f"✅ Found {count} repositories")
+
+def get_repositories(session, org_name, token=None):
+    """Fetch all repositories from the organization (an empty list if the listing failed)"""
+    try:
+        return list(iter_repositories(session, org_name, token))
+    except ListingError:
+        return []
+
+# Absolute path of the git executable, looked up once instead of searching PATH on every spawn
+GIT = shutil.which('git') or 'git'
+
+# Variables pointing git at another repository (each git run uses its cwd) or at a password prompt
+GIT_ENV_DROP = ('GIT_DIR', 'GIT_WORK_TREE', 'GIT_INDEX_FILE', 'GIT_OBJECT_DIRECTORY',
+                'GIT_ALTERNATE_OBJECT_DIRECTORIES', 'GIT_ASKPASS', 'SSH_ASKPASS')
+
+@lru_cache(maxsize=None)
+def git_env():
+    """Environment for git child processes, built once on first use (after load_config())"""
+    # The user's git config, proxies, CA bundles and ssh settings all come from the environment.
+    # Prompting is disabled so a repository needing credentials fails instead of blocking a worker.
+    env = {key: value for key, value in os.environ.items() if key not in GIT_ENV_DROP}
+    env.update({'GIT_TERMINAL_PROMPT': '0', 'LC_ALL': 'C'})
+    return env
+
+GIT_AUTH_HEADER_KEY = 'http.https://github.com/.extraheader'
+
+@lru_cache(maxsize=None)
+def git_reads_config_env():
+    """Whether git takes config from GIT_CONFIG_COUNT/KEY/VALUE, which needs git 2.31+"""
+    try:
+        output = subprocess.run([GIT, "--version"], env=git_env(), capture_output=True, text=True).stdout
+        version = tuple(int(part) for part in re.findall(r'\d+', output)[:2])
+    except (OSError, ValueError):
+        return True
+    if version < (2, 31):
+        print(f"⚠️  {output.strip()} is older than 2.31 - the GitHub token is passed to git on the command line")
+        return False
+    return True
+
+def git_auth_header(token):
+    """The git http.extraheader value authenticating as the token"""
+    credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+    return f'Authorization: Basic {credentials}'
+
+@lru_cache(maxsize=None)
+def git_auth_env(token=None):
+    """git_env() plus the token as an HTTP Authorization header for github.com"""
+    if not token or not git_reads_config_env():
+        return git_env()
+    # Unlike a token URL or `git -c`, this stays out of .git/config and the process list.
+    # Added after any GIT_CONFIG_* entries the user already has in the environment.
+    count = int(git_env().get('GIT_CONFIG_COUNT') or 0)
+    return {
+        **git_env(),
+        'GIT_CONFIG_COUNT': str(count + 1),
+        f'GIT_CONFIG_KEY_{count}': GIT_AUTH_HEADER_KEY,
+        f'GIT_CONFIG_VALUE_{count}': git_auth_header(token),
+    }
+
+def git_auth_args(token=None):
+    """`git -c` arguments carrying the token for git older than 2.31, which ignores git_auth_env"""
+    if not token or git_reads_config_env():
+        return []
+    return ["-c", f"{GIT_AUTH_HEADER_KEY}={git_auth_header(token)}"]
+
+# Extra `git clone` arguments for each CLONE_MODE
+CLONE_MODE_ARGS = {
+    'full': [],
+    'shallow': ["--depth=1", "--single-branch", "--no-tags"],  # latest commit of the default branch only
+    'blobless': ["--filter=blob:none"],                        # full history, file contents fetched on demand
+    'mirror': ["--mirror"],                                    # bare backup copy of all refs
+}
+
+def get_submodule_args(clone_mode):
+    """Extra `git clone` arguments to fetch submodules in parallel when CLONE_SUBMODULES=1"""
+    if os.getenv('CLONE_SUBMODULES', '0') != '1' or clone_mode == 'mirror':
+        return []
+    args = ["--recurse-submodules", "--jobs=4"]
+    if clone_mode == 'shallow':
+        args.append("--shallow-submodules")
+    return args
+
+# pygit2.clone_repository() options for the CLONE_MODEs libgit2 supports
+PYGIT2_CLONE_OPTIONS = {
+    'full': {},
+    'shallow': {'depth': 1},
+}
+
+def get_clone_mode():
+    """Return the configured CLONE_MODE"""
+    mode = os.getenv('CLONE_MODE', 'full')
+    if mode not in CLONE_MODE_ARGS:
+        print(f"⚠️  Unknown CLONE_MODE '{mode}' - using full clones")
+        mode = 'full'
+    return mode
+
+def use_pygit2(clone_mode=None):
+    """Whether to clone/sync in-process with pygit2 instead of spawning git (GIT_BACKEND=pygit2)"""
+    if os.getenv('GIT_BACKEND', 'git') != 'pygit2':
+        return False
+    if pygit2 is None:
+        print("⚠️  GIT_BACKEND=pygit2 but pygit2 is not installed - using the git command line")
+        return False
+    if clone_mode is not None and clone_mode not in PYGIT2_CLONE_OPTIONS:
+        print(f"⚠️  CLONE_MODE '{clone_mode}' is not supported by pygit2 - using the git command line")
+        return False
+    return True
+
+def pygit2_callbacks(token=None):
+    """Remote callbacks supplying the GitHub token to libgit2, if there is one"""
+    if not token:
+        return None
+    return pygit2.RemoteCallbacks(credentials=pygit2.UserPass('x-access-token', token))
+
+def is_local_repo(path):
+    """Check whether path is a cloned repository (working tree or bare mirror)"""
+    if os.path.exists(os.path.join(path, ".git")):
+        return True
+    return os.path.isfile(os.path.join(path, "HEAD")) and os.path.isdir(os.path.join(path, "objects"))
+
+def scan_local_dirs(master_folder):
+    """Scan the master folder's directories, returning {name: (os.DirEntry, is a repository)}"""
+    # Leftover non-repository directories are kept too: git clone refuses to clone into them.
+    # DirEntry.is_dir() is answered from the directory listing itself, without an extra stat
+    with os.scandir(master_folder) as entries:
+        return {entry.name: (entry, is_local_repo(entry.path)) for entry in entries if entry.is_dir()}
+
+def list_local_repos(master_folder, local_dirs=None):
+    """List the repository directories in the master folder as os.DirEntry objects"""
+    # local_dirs is passed in when the caller has already scanned the folder
+    if local_dirs is None:
+        local_dirs = scan_local_dirs(master_folder)
+    return [entry for entry, is_repo in local_dirs.values() if is_repo]
+
+def get_job_count(env_var, default):
+    """Read a worker count from the environment, falling back to default"""
+    try:
+        jobs = int(os.getenv(env_var, default))
+    except ValueError:
+        print(f"⚠️  Ignoring invalid {env_var} value: {os.getenv(env_var)}")
+        jobs = default
+    return max(1, jobs)
+
+def default_clone_jobs():
+    """Default number of concurrent clones: 75% of the CPUs, between 4 and 8"""
+    # Cloning is network-bound, so small machines still benefit from a few workers
+    return min(8, max(4, int((os.cpu_count() or 1) * 0.75)))
+
+def create_clone_executor(jobs, in_process=False):
+    """Create the clone worker pool, chosen with GIT_CLONE_EXECUTOR=thread|process"""
+    kind = os.getenv('GIT_CLONE_EXECUTOR')
+    if kind not in ('thread', 'process'):
+        if kind:
+            print(f"⚠️  Unknown GIT_CLONE_EXECUTOR '{kind}' - choosing automatically")
+        # git subprocesses only need threads to wait on; many in-process pygit2 clones get
+        # their own processes so a libgit2 crash only takes down one worker
+        kind = 'process' if in_process and jobs >= 8 else 'thread'
+    if kind == 'process':
+        return ProcessPoolExecutor(max_workers=jobs)
+    return ThreadPoolExecutor(max_workers=jobs)
+
+# Messages from `git pull --ff-only` (LC_ALL=C) meaning the fetch worked but the merge was refused
+PULL_FETCHED_ONLY_MARKERS = (
+    "Not possible to fast-forward",
+    "would be overwritten by merge",
+)
+
+def _upstream_unchanged(repo_dir, token=None):
+    """Check whether the checked-out branch is level with its upstream on origin, without fetching"""
+    try:
+        # HEAD, its upstream and the upstream's name (e.g. refs/remotes/origin/main) in one call
+        local = subprocess.run(
+            [GIT, "rev-parse", "HEAD", "@{u}", "--symbolic-full-name", "@{u}"],
+            cwd=repo_dir.path, env=git_env(),
+            capture_output=True, text=True, timeout=60
+        )
+        if local.returncode != 0:
+            return False  # detached HEAD or no upstream
+        head_sha, upstream_sha, upstream_ref = local.stdout.split()
+        if head_sha != upstream_sha or not upstream_ref.startswith("refs/remotes/origin/"):
+            return False
+        
+        # ls-remote only reads the ref advertisement, so an idle repository costs
+        # one small request instead of a fetch negotiation
+        branch_ref = "refs/heads/" + upstream_ref[len("refs/remotes/origin/"):]
+        remote = subprocess.run(
+            [GIT, *git_auth_args(token), "ls-remote", "origin", branch_ref],
+            cwd=repo_dir.path, env=git_auth_env(token),
+            capture_output=True, text=True, timeout=60
+        )
+    except Exception:
+        return False
+    if remote.returncode != 0:
+        return False
+    return remote.stdout.split()[:1] == [upstream_sha]
+
+def _sync_one(repo_dir, token=None):
+    """Fast-forward a single repository (an os.DirEntry), returning (repo_name, status)"""
+    if os.path.exists(os.path.join(repo_dir.path, ".git")):
+        # Nothing to pull when the checked-out branch's upstream has not moved on origin
+        if _upstream_unchanged(repo_dir, token):
+            return repo_dir.name, "up to date"
+        # git pull fetches by itself, so a separate fetch would only add a round-trip.
+        # Shallow clones stay shallow: only commits newer than the boundary are fetched.
+        args = [GIT, *git_auth_args(token), "pull", "--ff-only"]
+        if os.getenv('CLONE_SUBMODULES', '0') == '1':
+            args.append("--recurse-submodules")
+    else:
+        # Bare mirrors have no working tree to merge into
+        args = [GIT, *git_auth_args(token), "remote", "update", "--prune"]
     
-    print(f"✅ Found {len(repos)} repositories")
-    return repos
+    try:
+        result = subprocess.run(
+            args,
+            cwd=repo_dir.path,
+            env=git_auth_env(token),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=120
+        )
+        if result.returncode == 0:
+            return repo_dir.name, "synced"
+        # A diverged branch or local changes still leave the remote-tracking branches updated
+        if any(marker in result.stderr for marker in PULL_FETCHED_ONLY_MARKERS):
+            return repo_dir.name, "fetched only"
+        return repo_dir.name, "sync failed"
+    except Exception:
+        return repo_dir.name, "sync failed"
 
-def sync_repositories(master_folder):
+def _sync_one_pygit2(repo_dir, token=None):
+    """Fast-forward a single repository in-process with pygit2, returning (repo_name, status)"""
+    try:
+        repo = pygit2.Repository(repo_dir.path)
+    except Exception:
+        # libgit2 cannot open some repositories git can, e.g. partial clones
+        # (extensions.partialClone) left by a blobless run
+        return _sync_one(repo_dir, token)
+    try:
+        repo.remotes['origin'].fetch(callbacks=pygit2_callbacks(token))
+    except Exception:
+        return repo_dir.name, "sync failed"
+    if repo.is_bare:
+        return repo_dir.name, "synced"
+    
+    try:
+        branch = repo.branches.local[repo.head.shorthand]
+        upstream = branch.upstream
+        if upstream is None:
+            return repo_dir.name, "fetched only"
+        
+        analysis, _ = repo.merge_analysis(upstream.target)
+        if analysis & pygit2.GIT_MERGE_ANALYSIS_UP_TO_DATE:
+            return repo_dir.name, "synced"
+        if not analysis & pygit2.GIT_MERGE_ANALYSIS_FASTFORWARD:
+            return repo_dir.name, "fetched only"
+        
+        # Same as `git pull --ff-only`: the default safe checkout refuses to overwrite local changes
+        repo.checkout_tree(repo.get(upstream.target))
+        branch.set_target(upstream.target)
+        return repo_dir.name, "synced"
+    except Exception:
+        return repo_dir.name, "fetched only"
+
+def sync_repositories(master_folder, token=None, repo_dirs=None, in_process=None):
     """Sync existing repositories by pulling latest changes"""
     successful = 0
     failed = 0
+    jobs = get_job_count('GIT_SYNC_JOBS', 8)
+    # in_process (use pygit2) is passed in when main() has already resolved the backend
+    if in_process is None:
+        in_process = use_pygit2(get_clone_mode())
+    sync_one = _sync_one_pygit2 if in_process else _sync_one
     
-    print(f"\n🔄 Syncing existing repositories in {master_folder}")
+    print(f"\n🔄 Syncing existing repositories in {master_folder} ({jobs} parallel jobs)")
     
-    # Update summary file for sync operation
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    summary_file = master_folder / "clone_summary.txt"
-    with open(summary_file, 'a') as f:
-        f.write(f"\nSYNC OPERATION - {timestamp}\n")
-        f.write("----------------------------------------\n")
+    # repo_dirs is passed in when the caller has already scanned the folder
+    if repo_dirs is None:
+        repo_dirs = list_local_repos(master_folder)
     
-    for repo_dir in master_folder.iterdir():
-        if repo_dir.is_dir() and (repo_dir / ".git").exists():
-            repo_name = repo_dir.name
-            print(f"Syncing {repo_name}...", end=" ")
-            
-            try:
-                # Try git fetch and pull
-                fetch_result = subprocess.run(
-                    ["git", "fetch", "--all"],
-                    cwd=repo_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                pull_result = subprocess.run(
-                    ["git", "pull"],
-                    cwd=repo_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if pull_result.returncode == 0:
-                    print("✅")
-                    with open(summary_file, 'a') as f:
-                        f.write(f"✅ {repo_name} (synced)\n")
-                    successful += 1
-                elif fetch_result.returncode == 0:
-                    print("🔄 (fetched only)")
-                    with open(summary_file, 'a') as f:
-                        f.write(f"🔄 {repo_name} (fetched only)\n")
-                    successful += 1
-                else:
-                    print("❌")
-                    with open(summary_file, 'a') as f:
-                        f.write(f"❌ {repo_name} (sync failed)\n")
-                    failed += 1
-                    
-            except Exception:
-                print("❌")
-                with open(summary_file, 'a') as f:
-                    f.write(f"❌ {repo_name} (sync failed)\n")
+    # The summary is opened once and only written from the main thread. Line buffering keeps
+    # the results so far on disk if the run is interrupted.
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(master_folder / "clone_summary.txt", 'a', buffering=1) as summary, \
+            ThreadPoolExecutor(max_workers=jobs) as executor:
+        summary.write(f"\nSYNC OPERATION - {timestamp}\n")
+        summary.write("----------------------------------------\n")
+        
+        futures = [executor.submit(sync_one, repo_dir, token) for repo_dir in repo_dirs]
+        
+        for i, future in enumerate(as_completed(futures), 1):
+            repo_name, status = future.result()
+            if status == "synced":
+                print(f"[{i}/{len(repo_dirs)}] Synced {repo_name} ✅")
+                summary.write(f"✅ {repo_name} (synced)\n")
+                successful += 1
+            elif status == "up to date":
+                print(f"[{i}/{len(repo_dirs)}] Synced {repo_name} ✅ (up to date)")
+                summary.write(f"✅ {repo_name} (up to date)\n")
+                successful += 1
+            elif status == "fetched only":
+                print(f"[{i}/{len(repo_dirs)}] Synced {repo_name} 🔄 (fetched only)")
+                summary.write(f"🔄 {repo_name} (fetched only)\n")
+                successful += 1
+            else:
+                print(f"[{i}/{len(repo_dirs)}] Syncing {repo_name} ❌")
+                summary.write(f"❌ {repo_name} (sync failed)\n")
                 failed += 1
-    
-    with open(summary_file, 'a') as f:
-        f.write("----------------------------------------\n")
-        f.write(f"SYNC SUMMARY: {successful} successful, {failed} failed\n")
-        f.write("========================================\n")
+        
+        summary.write("----------------------------------------\n")
+        summary.write(f"SYNC SUMMARY: {successful} successful, {failed} failed\n")
+        summary.write("========================================\n")
     
     if successful > 0 or failed > 0:
         print(f"\n📊 Sync Summary: {successful} successful, {failed} failed")
@@ -202,67 +684,123 @@ def sync_repositories(master_folder):
         print(f"\n📊 No repositories found to sync")
     return successful, failed
 
-def clone_repositories(repos, master_folder, token=None):
-    """Clone all repositories into the master folder"""
+def _clone_one(repo, master_folder, token=None, clone_args=()):
+    """Clone a single repository, returning (repo_name, ok, err)"""
+    repo_name = repo.name
+    repo_path = os.path.join(master_folder, repo_name)
+    
+    try:
+        result = subprocess.run(
+            [GIT, *git_auth_args(token), "clone", *clone_args, repo.clone_url, repo_path],
+            env=git_auth_env(token),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=300
+        )
+        
+        if result.returncode == 0:
+            return repo_name, True, None
+        error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+        return repo_name, False, error_msg
+    
+    except Exception as e:
+        return repo_name, False, str(e)
+
+def _clone_one_pygit2(repo, master_folder, token=None, clone_mode='full'):
+    """Clone a single repository in-process with pygit2, returning (repo_name, ok, err)"""
+    repo_name = repo.name
+    try:
+        # libgit2 releases the GIL while transferring, so this parallelises in the thread pool
+        pygit2.clone_repository(
+            repo.clone_url,
+            os.path.join(master_folder, repo_name),
+            callbacks=pygit2_callbacks(token),
+            **PYGIT2_CLONE_OPTIONS[clone_mode]
+        )
+        return repo_name, True, None
+    except Exception as e:
+        return repo_name, False, str(e)
+
+def clone_repositories(repos, master_folder, token=None, local_dirs=None, clone_mode=None, in_process=None):
+    """Clone all repositories into the master folder, starting as soon as the first one is listed"""
     successful = 0
     failed = 0
+    jobs = get_job_count('GIT_CLONE_JOBS', default_clone_jobs())
+    # The clone mode and backend are passed in when main() has already resolved them
+    if clone_mode is None:
+        clone_mode = get_clone_mode()
+    if in_process is None:
+        in_process = use_pygit2(clone_mode)
+    if in_process:
+        clone_one, clone_option = _clone_one_pygit2, clone_mode
+    else:
+        clone_one, clone_option = _clone_one, CLONE_MODE_ARGS[clone_mode] + get_submodule_args(clone_mode)
     
-    print(f"\n🚀 Cloning {len(repos)} repositories into {master_folder}")
+    if hasattr(repos, '__len__'):
+        print(f"\n🚀 Cloning {len(repos)} repositories into {master_folder} ({jobs} parallel jobs)")
+    else:
+        print(f"\n🚀 Cloning repositories into {master_folder} as they are listed ({jobs} parallel jobs)")
     
-    # Add cloned repos header to summary
-    summary_file = master_folder / "clone_summary.txt"
-    with open(summary_file, 'a') as f:
-        f.write("\nCLONED REPOSITORIES:\n")
-        f.write("----------------------------------------\n")
+    # Workers build plain string paths rather than a new Path object per repository.
+    # Arguments are plain tuples and strings so they can also be sent to worker processes.
+    target_folder = os.fspath(master_folder)
     
-    for i, repo in enumerate(repos, 1):
-        repo_name = repo['name']
-        is_private = repo.get('private', False)
-        
-        # Use authenticated URL for private repos or when token is available
-        if token and (is_private or True):  # Use token for all repos when available
-            clone_url = f"https://{token}@github.com/{repo['full_name']}.git"
-        else:
-            clone_url = repo['clone_url']
+    # The directory scan tells which repositories are already cloned, and which leftover
+    # directories git clone would refuse to clone into (passed in if main() already scanned)
+    if local_dirs is None:
+        local_dirs = scan_local_dirs(target_folder)
+    already_cloned = 0
+    
+    with open(master_folder / "clone_summary.txt", 'a', buffering=1) as summary, \
+            create_clone_executor(jobs, clone_one is _clone_one_pygit2) as executor:
+        summary.write("\nCLONED REPOSITORIES:\n")
+        summary.write("----------------------------------------\n")
         
-        repo_path = master_folder / repo_name
-        privacy_indicator = "🔒" if is_private else "🔓"
+        futures = {}
+        for repo in repos:
+            if repo.name in local_dirs:
+                if local_dirs[repo.name][1]:
+                    already_cloned += 1
+                    continue
+                repo_path = os.path.join(target_folder, repo.name)
+                try:
+                    with os.scandir(repo_path) as leftover:
+                        occupied = any(leftover)
+                except FileNotFoundError:
+                    occupied = False  # removed since the folder was scanned
+                except OSError as e:
+                    print(f"⚠️  Skipping {repo.name}: cannot read {repo_path} ({e.strerror})")
+                    summary.write(f"⚠️  {repo.name} (SKIPPED: {e.strerror})\n")
+                    failed += 1
+                    continue
+                if occupied:
+                    print(f"⚠️  Skipping {repo.name}: {repo_path} exists but is not a git repository")
+                    summary.write(f"⚠️  {repo.name} (SKIPPED: directory exists without a repository)\n")
+                    failed += 1
+                    continue
+            futures[executor.submit(clone_one, repo, target_folder, token, clone_option)] = repo
         
-        print(f"[{i}/{len(repos)}] Cloning {privacy_indicator} {repo_name}...", end=" ")
+        if already_cloned:
+            print(f"⏭️  Skipping {already_cloned} repositories that are already cloned")
         
-        try:
-            result = subprocess.run(
-                ["git", "clone", clone_url, str(repo_path)],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+        for i, future in enumerate(as_completed(futures), 1):
+            repo_name, ok, error_msg = future.result()
+            privacy_indicator = "🔒" if futures[future].private else "🔓"
             
-            if result.returncode == 0:
-                print("✅")
-                with open(summary_file, 'a') as f:
-                    f.write(f"✅ {privacy_indicator} {repo_name}\n")
+            if ok:
+                print(f"[{i}/{len(futures)}] Cloned {privacy_indicator} {repo_name} ✅")
+                summary.write(f"✅ {privacy_indicator} {repo_name}\n")
                 successful += 1
             else:
-                print("❌")
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+                print(f"[{i}/{len(futures)}] Cloning {privacy_indicator} {repo_name} ❌")
                 print(f"   Error: {error_msg[:100]}")
-                with open(summary_file, 'a') as f:
-                    f.write(f"❌ {privacy_indicator} {repo_name} (FAILED: {error_msg[:50]})\n")
+                summary.write(f"❌ {privacy_indicator} {repo_name} (FAILED: {error_msg[:50]})\n")
                 failed += 1
-                
-        except Exception as e:
-            print("❌")
-            print(f"   Error: {str(e)[:100]}")
-            with open(summary_file, 'a') as f:
-                f.write(f"❌ {privacy_indicator} {repo_name} (FAILED: {str(e)[:50]})\n")
-            failed += 1
-    
-    # Add summary footer
-    with open(summary_file, 'a') as f:
-        f.write("----------------------------------------\n")
-        f.write(f"SUMMARY: {successful} successful, {failed} failed\n")
-        f.write("========================================\n")
+        
+        summary.write("----------------------------------------\n")
+        summary.write(f"SUMMARY: {successful} successful, {failed} failed\n")
+        summary.write("========================================\n")
     
     print(f"\n📊 Summary: {successful} successful, {failed} failed")
     return successful, failed
@@ -276,10 +814,20 @@ def main():
 
     print(f"🔄 Cloning all repositories from organization: {org_name}")
     
+    # One session for all API calls so the connection to api.github.com is reused
+    session = create_session(token)
+    
     # Validate token first
-    token_valid = validate_token(token)
+    token_valid = validate_token(session, token)
     if not token_valid and token:
         print("⚠️  Continuing with invalid token - some operations may fail")
+    if token:
+        # Settle once, before the worker threads need it, how git is given the token
+        git_reads_config_env()
+    
+    # Resolved once so their warnings are not repeated by both the clone and the sync step
+    clone_mode = get_clone_mode()
+    in_process = use_pygit2(clone_mode)
 
     # Use MASTER_FOLDER from environment/config, default to 'cloned_repos'
     master_folder_base = os.getenv('MASTER_FOLDER', 'cloned_repos')
@@ -299,52 +847,50 @@ def main():
     
     print(f"📁 Target folder: {master_folder}")
     
-    # Get repositories from the organization first
-    repos = get_repositories(org_name, token)
-    if not repos:
-        print("❌ No repositories found in organization")
-        return
-    
-    # Print repository statistics and update summary file
-    stats = print_repo_summary(repos, f"Organization: {org_name}")
-    with open(summary_file, 'a') as f:
-        f.write("REPOSITORY STATISTICS:\n")
-        f.write(f"🔓 Public repositories:  {stats['public']}\n")
-        f.write(f"🔒 Private repositories: {stats['private']}\n")
-        f.write(f"📦 Total repositories:   {stats['total']}\n")
-        f.write("========================================\n")
-    
     # Check if folder already exists with repos
-    existing_repos = [d for d in master_folder.iterdir() if d.is_dir() and (d / ".git").exists()]
+    # Scanned once; the same scan is used to find repositories to sync and to skip when cloning
+    local_dirs = scan_local_dirs(master_folder)
+    existing_repos = list_local_repos(master_folder, local_dirs)
     if existing_repos:
         print(f"📂 Folder {master_folder} already exists with repositories.")
         
+        # Get repositories from the organization first
+        repos = get_repositories(session, org_name, token)
+        if not repos:
+            print("❌ No repositories found in organization")
+            return
+        
+        # Print repository statistics and update summary file
+        stats = print_repo_summary(repos, f"Organization: {org_name}")
+        write_repo_statistics(summary_file, stats)
+        
         # Get list of existing repo names
         existing_repo_names = {d.name for d in existing_repos}
         
         # Find missing repositories that need to be cloned
-        missing_repos = [repo for repo in repos if repo['name'] not in existing_repo_names]
+        missing_repos = [repo for repo in repos if repo.name not in existing_repo_names]
         
         if missing_repos:
             print(f"🆕 Found {len(missing_repos)} new repositories to clone:")
             missing_stats = get_repo_statistics(missing_repos)
             print(f"   🔓 Public: {missing_stats['public']}, 🔒 Private: {missing_stats['private']}")
             for repo in missing_repos:
-                privacy_indicator = "🔒" if repo.get('private', False) else "🔓"
-                print(f"   {privacy_indicator} {repo['name']}")
+                privacy_indicator = "🔒" if repo.private else "🔓"
+                print(f"   {privacy_indicator} {repo.name}")
             
             # Clone missing repositories
-            clone_repositories(missing_repos, master_folder, token)
+            newly_cloned, _ = clone_repositories(missing_repos, master_folder, token, local_dirs, clone_mode, in_process)
         else:
             print("✅ All organization repositories are already cloned")
+            newly_cloned = 0
         
-        # Sync all existing repositories
+        # Sync the repositories that existed before this run; fresh clones are already current
         print(f"\n🔄 Syncing existing repositories...")
-        sync_repositories(master_folder)
+        sync_repositories(master_folder, token, existing_repos, in_process)
         
         # Final summary
         total_repos = len(repos)
-        cloned_repos = len([d for d in master_folder.iterdir() if d.is_dir() and (d / ".git").exists()])
+        cloned_repos = len(existing_repos) + newly_cloned
         print(f"\n🎉 Final Status:")
         print(f"📁 Location: {master_folder.absolute()}")
         print(f"📦 Local repositories: {cloned_repos}/{total_repos}")
@@ -358,12 +904,44 @@ def main():
             f.write("========================================\n")
         return
 
-    # Fresh clone - no existing repos
-    print_repo_summary(repos, "Cloning All Repositories")
-    clone_repositories(repos, master_folder, token)
+    # Fresh clone - no existing repos. Stream the listing straight into the clone pool
+    # so cloning starts while later pages are still being fetched.
+    repos = []
+    listing_complete = True
+    
+    def record(repo_stream):
+        # A failed page ends the stream quietly so clones already started can finish;
+        # the run is then reported as incomplete below
+        nonlocal listing_complete
+        try:
+            for repo in repo_stream:
+                repos.append(repo)
+                yield repo
+        except ListingError:
+            listing_complete = False
+    
+    repo_stream = record(iter_repositories(session, org_name, token))
+    first_repo = next(repo_stream, None)
+    if first_repo is None:
+        print("❌ No repositories found in organization")
+        return
+    cloned_repos, _ = clone_repositories(chain([first_repo], repo_stream), master_folder, token, local_dirs,
+                                         clone_mode, in_process)
+    
+    if not listing_complete:
+        print(f"\n❌ Repository listing for {org_name} is incomplete - cloned {cloned_repos} of the {len(repos)} repositories listed")
+        print("   💡 Run the script again to clone the remaining repositories")
+        with open(summary_file, 'a') as f:
+            f.write(f"\nFINAL STATUS:\n")
+            f.write(f"❌ Repository listing incomplete: cloned {cloned_repos} of {len(repos)} listed repositories\n")
+            f.write("========================================\n")
+        return
+    
+    # Statistics are only known once the whole listing has been streamed
+    stats = print_repo_summary(repos, f"Organization: {org_name}")
+    write_repo_statistics(summary_file, stats)
     
     # Final summary for fresh clone
-    cloned_repos = len([d for d in master_folder.iterdir() if d.is_dir() and (d / ".git").exists()])
     print(f"\n🎉 All repositories cloned!")
     print(f"📁 Location: {master_folder.absolute()}")
     print(f"📦 Cloned: {cloned_repos}/{stats['total']} repositories")
@@ -371,7 +949,7 @@ def main():
     
     # Update summary file with final status
     with open(summary_file, 'a') as f:
-        f.write(f"\nFINAL STATUS:\n")
+        f.write("\nFINAL STATUS:\n")
         f.write(f"📦 Cloned: {cloned_repos}/{stats['total']} repositories\n")
         f.write(f"🔓 Public: {stats['public']} | 🔒 Private: {stats['private']}\n")
         f.write("========================================\n")